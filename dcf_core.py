@@ -0,0 +1,102 @@
+"""Shared DCF model for the Greatland Gold Streamlit apps (all amounts in A$)."""
+from dataclasses import dataclass
+
+import numpy as np
+import streamlit as st
+
+# year index shared by every run; run_dcf slices it to the horizon
+_YEARS20 = np.arange(1, 21, dtype=np.int64)
+_YEARS20.setflags(write=False)  # results hand out views of it
+
+
+@dataclass(frozen=True)
+class DcfParams:
+    production_y1: float
+    production_growth: float
+    gold_price_aud: float
+    aisc_y1: float
+    aisc_improvement: float
+    corp_costs: float
+    capex_y1: float
+    capex_decline_to: float
+    wacc: float
+    terminal_multiple: float
+    cash_balance: float
+    deferred_liability: float
+    shares_out: float
+    # capex moves capex_ramp_rate of the Y1 → steady-state gap per year for
+    # capex_ramp_years years after year 1, then sits at steady state
+    capex_ramp_rate: float = 0.2
+    capex_ramp_years: int = 4
+
+
+@dataclass(frozen=True)
+class DcfResult:
+    years: np.ndarray
+    prod_profile: np.ndarray  # production relative to year 1
+    productions: np.ndarray
+    aiscs: np.ndarray
+    capexes: np.ndarray
+    fcfs: np.ndarray
+    pvs: np.ndarray  # discounted FCF, terminal value included in the final year
+    enterprise_value: float
+    equity_value: float
+    value_per_share: float
+
+
+# cached on the inputs, so reruns with unchanged assumptions skip the model
+@st.cache_data
+def run_dcf(params: DcfParams, horizon: int) -> DcfResult:
+    p = params
+    if not 1 <= horizon <= _YEARS20.size:
+        raise ValueError(f"horizon must be between 1 and {_YEARS20.size} years, got {horizon}")
+    year_idx = _YEARS20[:horizon]
+    # (1 + wacc) ** -t as exp(-t * log1p(wacc)): one vectorised exp instead of pow
+    discount = np.exp(-np.log1p(p.wacc) * year_idx)
+
+    # production: grow to yr5, flat to yr15, then -1%/yr; the profile is a
+    # template that the sensitivity grid scales by each year-1 production
+    growth = np.ones(horizon)
+    growth[1:5] = 1 + p.production_growth
+    growth[15:] = 0.99
+    prod_profile = np.cumprod(growth)
+    productions = p.production_y1 * prod_profile
+
+    # AISC: improve to yr5, floor to avoid negative, then flat
+    aiscs = np.maximum(p.aisc_y1 - p.aisc_improvement * np.minimum(year_idx - 1, 4), 1_600)
+    aiscs[0] = p.aisc_y1
+
+    # capex: high early, ramp down to steady state
+    capexes = np.full(horizon, p.capex_decline_to, dtype=np.float64)
+    capexes[0] = p.capex_y1
+    gap = p.capex_y1 - p.capex_decline_to
+    if gap > 0:
+        ramp = slice(1, p.capex_ramp_years + 1)
+        capexes[ramp] = np.maximum(p.capex_y1 - p.capex_ramp_rate * gap * (year_idx[ramp] - 1), p.capex_decline_to)
+
+    fcfs = (p.gold_price_aud - aiscs) * productions - p.corp_costs - capexes
+
+    # discount FCFs and add terminal value in the final year
+    totals = fcfs.copy()
+    totals[-1] += fcfs[-1] * p.terminal_multiple
+    pvs = totals * discount
+
+    enterprise_value = pvs.sum()
+    equity_value = enterprise_value + p.cash_balance - p.deferred_liability
+    return DcfResult(
+        year_idx, prod_profile, productions, aiscs, capexes, fcfs, pvs,
+        enterprise_value, equity_value, equity_value / p.shares_out,
+    )
+
+
+# st.cache_data still hashes the arguments and unpickles the result on every
+# hit; when the inputs match this session's last rerun, hand back that object
+def from_session(name, key, compute):
+    if st.session_state.get(f"{name}_key") != key:
+        st.session_state[f"{name}_result"] = compute()
+        st.session_state[f"{name}_key"] = key
+    return st.session_state[f"{name}_result"]
+
+
+def latest_dcf(params: DcfParams, horizon: int) -> DcfResult:
+    return from_session("dcf", (params, horizon), lambda: run_dcf(params, horizon))
@@ -0,0 +1,50 @@
+"""Gold price × production sensitivity grid for the 20-year app."""
+import numpy as np
+import streamlit as st
+from numba import njit
+
+from dcf_core import DcfParams, DcfResult, from_session
+
+
+# serial Horner NPV in r = 1 / (1 + wacc) per (gold, prod) cell; compiled eagerly from the signature
+@njit(
+    "float64[:, :](float64[:], float64[:], float64[:], float64[:], float64[:], "
+    "float64, float64, float64, float64, float64, float64)",
+    cache=True,
+)
+def sens_grid(gold_arr, prod_arr, prod_profile, aiscs, capexes, corp_costs,
+              wacc, terminal_multiple, cash_balance, deferred_liability, shares_out):
+    last = aiscs.shape[0] - 1
+    r = 1.0 / (1.0 + wacc)
+    # everything below is the same for every cell, so it is built once
+    fixed_costs = corp_costs + capexes
+    net_cash = cash_balance - deferred_liability
+    gbp_per_share = 1.0 / (shares_out * 2)
+    out = np.empty((gold_arr.shape[0], prod_arr.shape[0]))
+    for gi in range(gold_arr.shape[0]):
+        for pj in range(prod_arr.shape[0]):
+            # final year carries the terminal value
+            ev_tmp_aud = ((gold_arr[gi] - aiscs[last]) * prod_arr[pj] * prod_profile[last]
+                          - fixed_costs[last]) * (1.0 + terminal_multiple)
+            for i in range(last - 1, -1, -1):
+                ev_tmp_aud = ev_tmp_aud * r + (gold_arr[gi] - aiscs[i]) * prod_arr[pj] * prod_profile[i] - fixed_costs[i]
+            ev_tmp_aud *= r
+            out[gi, pj] = (ev_tmp_aud + net_cash) * gbp_per_share
+    return out
+
+
+# value per share (£) for each gold price (rows) × year-1 production (columns);
+# reuses the AISC and capex paths from the main run
+@st.cache_data
+def run_sensitivity(params: DcfParams, result: DcfResult, gold_options, prod_options) -> np.ndarray:
+    p = params
+    return sens_grid(
+        np.asarray(gold_options, dtype=np.float64), np.asarray(prod_options, dtype=np.float64),
+        result.prod_profile, result.aiscs.astype(np.float64), result.capexes, float(p.corp_costs),
+        p.wacc, p.terminal_multiple, float(p.cash_balance), float(p.deferred_liability), float(p.shares_out),
+    ).round(2)
+
+
+def latest_sensitivity(params: DcfParams, result: DcfResult, gold_options, prod_options) -> np.ndarray:
+    key = (params, len(result.years), tuple(gold_options), tuple(prod_options))
+    return from_session("sensitivity", key, lambda: run_sensitivity(params, result, gold_options, prod_options))
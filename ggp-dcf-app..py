@@ -1,5 +1,5 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
 
 st.set_page_config(page_title="GGP Valuation Model (GBP)", layout="wide")
 
@@ -36,24 +36,19 @@ margin_per_oz = gold_price_gbp - aisc_gbp
 operating_cf = margin_per_oz * production_oz
 annual_fcf = operating_cf - corp_costs_gbp - growth_capex_gbp
 
-# Build forecast table
-years_list = list(range(1, years + 1))
-fcf_list = []
-discounted_list = []
+# Build forecast table (cached on the inputs, so unchanged reruns skip the model)
+@st.cache_data
+def run_dcf(annual_fcf, years, wacc, terminal_multiple):
+    years_list = np.arange(1, years + 1)
+    discount_factors = np.exp(-np.log1p(wacc) * years_list)  # (1 + wacc) ** -t
 
-for t in years_list:
-    fcf_t = annual_fcf
-    if t == years:
-        tv = annual_fcf * terminal_multiple
-        fcf_t_total = fcf_t + tv
-    else:
-        fcf_t_total = fcf_t
+    fcf_list = np.full(years, annual_fcf, dtype=np.float64)
+    fcf_list[-1] += annual_fcf * terminal_multiple  # terminal value in final year
+    discounted_list = fcf_list * discount_factors
+    return years_list, fcf_list, discounted_list, discounted_list.sum()
 
-    pv_t = fcf_t_total / ((1 + wacc) ** t)
-    fcf_list.append(fcf_t_total)
-    discounted_list.append(pv_t)
 
-equity_value_gbp = sum(discounted_list)
+years_list, fcf_list, discounted_list, equity_value_gbp = run_dcf(annual_fcf, years, wacc, terminal_multiple)
 value_per_share_gbp = equity_value_gbp / shares_out
 
 # --- Display main numbers ---
@@ -65,14 +60,19 @@ col3.metric("Equity value (£)", f"£{equity_value_gbp:,.0f}")
 st.metric("Value per share", f"£{value_per_share_gbp:,.2f}")
 
 # --- Table ---
-df = pd.DataFrame({
+import polars as pl  # only the table and chart need it
+
+df = pl.DataFrame({
     "Year": years_list,
     "FCF incl. TV in final year (£)": fcf_list,
     "Discounted FCF (£)": discounted_list,
 })
 st.subheader("Discounted cash flows (GBP)")
-st.dataframe(df.style.format("£{:,.0f}", na_rep="-"))
+st.dataframe(df, column_config={
+    "FCF incl. TV in final year (£)": st.column_config.NumberColumn(format="£%,.0f"),
+    "Discounted FCF (£)": st.column_config.NumberColumn(format="£%,.0f"),
+})
 
 # --- Chart ---
 st.subheader("Discounted FCF profile")
-st.line_chart(df.set_index("Year")["Discounted FCF (£)"])
+st.line_chart(df, x="Year", y="Discounted FCF (£)")
@@ -1,5 +1,7 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+
+from dcf_core import DcfParams, latest_dcf
 
 st.set_page_config(page_title="GGP 10-Year DCF", layout="wide")
 
@@ -63,77 +65,16 @@ aud_to_gbp = st.sidebar.number_input(
 )
 
 # ------------- CORE MODEL -------------
-years = list(range(1, 11))  # 10-year DCF
-productions = []
-aiscs = []
-capexes = []
-fcfs = []
-pvs = []
-
-prod = production_y1
-aisc = aisc_y1
-capex = capex_y1
-
-for year in years:
-    # production path
-    if year == 1:
-        prod = production_y1
-    elif year <= 5:
-        # grow for the first five years
-        prod = productions[-1] * (1 + production_growth)
-    else:
-        # flat after year 5
-        prod = productions[-1]
-
-    productions.append(prod)
-
-    # AISC path
-    if year == 1:
-        aisc = aisc_y1
-    elif year <= 5:
-        aisc = max(aiscs[-1] - aisc_improvement, 1600)  # floor to avoid negative
-    else:
-        aisc = aiscs[-1]  # flat
-    aiscs.append(aisc)
-
-    # capex path
-    if year == 1:
-        capex = capex_y1
-    elif year <= 4:
-        # linearly move toward steady-state
-        # e.g. 368 -> ... -> 150
-        # simple approach: drop 25% of the gap each year for years 2-4
-        gap = capexes[0] - capex_decline_to
-        capex = capexes[-1] - 0.33 * gap if gap > 0 else capex_decline_to
-        if capex < capex_decline_to:
-            capex = capex_decline_to
-    else:
-        capex = capex_decline_to
-    capexes.append(capex)
-
-    # operating cash flow
-    margin_per_oz = gold_price_aud - aisc
-    operating_cf = margin_per_oz * prod
-    fcf = operating_cf - corp_costs - capex
-    fcfs.append(fcf)
-
-# Discount FCFs and add terminal value
-for i, year in enumerate(years, start=1):
-    fcf = fcfs[i - 1]
-    if year == 10:
-        tv = fcfs[-1] * terminal_multiple
-        total_in_year = fcf + tv
-    else:
-        total_in_year = fcf
-
-    pv = total_in_year / ((1 + wacc) ** year)
-    pvs.append(pv)
-
-enterprise_value = sum(pvs)
-
-# Equity value = EV + cash – deferred
-equity_value = enterprise_value + cash_balance - deferred_liability
-value_per_share_aud = equity_value / shares_out
+params = DcfParams(
+    production_y1, production_growth, gold_price_aud, aisc_y1, aisc_improvement, corp_costs,
+    capex_y1, capex_decline_to, wacc, terminal_multiple, cash_balance, deferred_liability, shares_out,
+    # capex moves 33% of the gap toward steady-state in years 2-4
+    capex_ramp_rate=0.33, capex_ramp_years=3,
+)
+result = latest_dcf(params, horizon=10)
+productions, aiscs, capexes, fcfs, pvs = result.productions, result.aiscs, result.capexes, result.fcfs, result.pvs
+enterprise_value, equity_value = result.enterprise_value, result.equity_value
+value_per_share_aud = result.value_per_share
 value_per_share_gbp = value_per_share_aud * aud_to_gbp
 
 # ------------- DISPLAY -------------
@@ -145,19 +86,25 @@ col4.metric("Value per share (GBP)", f"£{value_per_share_gbp:,.2f}")
 
 st.subheader("10-Year cash-flow forecast")
 
-df = pd.DataFrame({
-    "Year": years,
-    "Production (oz)": [round(x) for x in productions],
-    "Gold price (A$/oz)": [gold_price_aud for _ in years],
-    "AISC (A$/oz)": [round(x) for x in aiscs],
-    "Growth/Dev Capex (A$)": [round(x) for x in capexes],
-    "FCF (A$)": [round(x) for x in fcfs],
-    "Discounted FCF (A$)": [round(x) for x in pvs],
+# the metrics are already on the page; only the forecast table needs polars
+import polars as pl
+
+df = pl.DataFrame({
+    "Year": result.years,
+    "Production (oz)": productions,
+    "Gold price (A$/oz)": np.full(result.years.size, gold_price_aud),
+    "AISC (A$/oz)": aiscs,
+    "Growth/Dev Capex (A$)": capexes,
+    "FCF (A$)": fcfs,
+    "Discounted FCF (A$)": pvs,
+})
+# formatting is applied client-side instead of via pandas Styler
+st.dataframe(df, column_config={
+    col: st.column_config.NumberColumn(format="%,.0f") for col in df.columns if col != "Year"
 })
-st.dataframe(df.style.format("{:,.0f}"))
 
 st.subheader("Discounted FCF profile")
-st.line_chart(df.set_index("Year")["Discounted FCF (A$)"])
+st.line_chart(df, x="Year", y="Discounted FCF (A$)")
 
 st.caption(
     "Defaults based on FY25 report: 285koz Y1, A$2,600/oz AISC, A$368m capex in Y1, "
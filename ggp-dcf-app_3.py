@@ -1,5 +1,7 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+
+from dcf_core import DcfParams, latest_dcf
 
 st.set_page_config(page_title="GGP 10-Year DCF (£ millions)", layout="wide")
 
@@ -27,37 +29,15 @@ deferred_liability = st.sidebar.number_input("Deferred liability (A$)", 0, 1_000
 shares_out = st.sidebar.number_input("Shares outstanding", 1_000_000, 5_000_000_000, 670_700_000, 1_000_000)
 
 # ── Core model ─────────────────────────────────────────────────
-years = list(range(1, 11))
-productions, aiscs, capexes, fcfs, pvs = [], [], [], [], []
-
-for year in years:
-    if year == 1:
-        prod, aisc, capex = production_y1, aisc_y1, capex_y1
-    else:
-        prod = productions[-1] * (1 + production_growth) if year <= 5 else productions[-1]
-        aisc = max(aiscs[-1] - aisc_improvement, 1600) if year <= 5 else aiscs[-1]
-        if year <= 4:
-            gap = capexes[0] - capex_decline_to
-            capex = capexes[-1] - 0.33 * gap if gap > 0 else capex_decline_to
-            capex = max(capex, capex_decline_to)
-        else:
-            capex = capex_decline_to
-    productions.append(prod); aiscs.append(aisc); capexes.append(capex)
-
-    margin = gold_price_aud - aisc
-    operating_cf = margin * prod
-    fcf = operating_cf - corp_costs - capex
-    fcfs.append(fcf)
-
-for i, year in enumerate(years, start=1):
-    fcf = fcfs[i - 1]
-    total = fcf + (fcfs[-1] * terminal_multiple if year == 10 else 0)
-    pv = total / ((1 + wacc) ** year)
-    pvs.append(pv)
-
-enterprise_value_aud = sum(pvs)
-equity_value_aud = enterprise_value_aud + cash_balance - deferred_liability
-value_per_share_aud = equity_value_aud / shares_out
+params = DcfParams(
+    production_y1, production_growth, gold_price_aud, aisc_y1, aisc_improvement, corp_costs,
+    capex_y1, capex_decline_to, wacc, terminal_multiple, cash_balance, deferred_liability, shares_out,
+    capex_ramp_rate=0.33, capex_ramp_years=3,
+)
+result = latest_dcf(params, horizon=10)
+productions, aiscs, capexes, fcfs, pvs = result.productions, result.aiscs, result.capexes, result.fcfs, result.pvs
+enterprise_value_aud, equity_value_aud = result.enterprise_value, result.equity_value
+value_per_share_aud = result.value_per_share
 
 # ── Convert to £ millions (A$ ÷ 2 ÷ 1,000,000) ─────────────────
 def aud_to_gbp_m(x): 
@@ -65,8 +45,8 @@ def aud_to_gbp_m(x):
 
 ev_gbp_m = aud_to_gbp_m(enterprise_value_aud)
 eq_gbp_m = aud_to_gbp_m(equity_value_aud)
-fcf_gbp_m = [aud_to_gbp_m(f) for f in fcfs]
-pv_gbp_m = [aud_to_gbp_m(p) for p in pvs]
+fcf_gbp_m = aud_to_gbp_m(fcfs)
+pv_gbp_m = aud_to_gbp_m(pvs)
 vps_gbp = value_per_share_aud / 2  # A$ ÷ 2 → £ per share
 
 # ── Display results ─────────────────────────────────────────────
@@ -76,17 +56,19 @@ col2.metric("Equity value", f"£ {eq_gbp_m:,.0f} m")
 col3.metric("Value per share", f"£ {vps_gbp:,.2f}")
 
 st.subheader("10-Year Cash-Flow Forecast (£ millions)")
-df = pd.DataFrame({
-    "Year": years,
-    "Production (oz)": [round(x) for x in productions],
-    "AISC (A$/oz)": [round(x) for x in aiscs],
-    "Capex (£ m)": [round(aud_to_gbp_m(x), 1) for x in capexes],
-    "FCF (£ m)": [round(x, 1) for x in fcf_gbp_m],
-    "Discounted FCF (£ m)": [round(x, 1) for x in pv_gbp_m],
+import polars as pl  # loaded after the £m metrics, for the table only
+
+df = pl.DataFrame({
+    "Year": result.years,
+    "Production (oz)": productions.round().astype(np.int64),
+    "AISC (A$/oz)": aiscs.round().astype(np.int64),
+    "Capex (£ m)": aud_to_gbp_m(capexes).round(1),
+    "FCF (£ m)": fcf_gbp_m.round(1),
+    "Discounted FCF (£ m)": pv_gbp_m.round(1),
 })
 st.dataframe(df)
 
 st.subheader("Discounted FCF Profile (£ m)")
-st.line_chart(df.set_index("Year")["Discounted FCF (£ m)"])
+st.line_chart(df, x="Year", y="Discounted FCF (£ m)")
 
 st.caption("All figures converted from AUD → GBP (÷2) and displayed in £ millions.")
@@ -1,5 +1,8 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+
+from dcf_core import DcfParams, latest_dcf
+from dcf_sensitivity import latest_sensitivity
 
 st.set_page_config(page_title="GGP 20-Year DCF (£m)", layout="wide")
 
@@ -37,75 +40,26 @@ shares_out = st.sidebar.number_input("Shares outstanding", 1_000_000, 5_000_000_
 # ─────────────────────────────────────────
 # CORE 20-YEAR DCF
 # ─────────────────────────────────────────
-years = list(range(1, 21))
-productions = []
-aiscs = []
-capexes = []
-fcfs = []
-pvs = []
-
-for year in years:
-    # production: grow to yr5, flat to yr15, then -1%/yr
-    if year == 1:
-        prod = production_y1
-    elif year <= 5:
-        prod = productions[-1] * (1 + production_growth)
-    elif year <= 15:
-        prod = productions[-1]
-    else:
-        prod = productions[-1] * 0.99
-    productions.append(prod)
-
-    # AISC: improve to yr5, then flat
-    if year == 1:
-        aisc = aisc_y1
-    elif year <= 5:
-        aisc = max(aiscs[-1] - aisc_improvement, 1_600)
-    else:
-        aisc = aiscs[-1]
-    aiscs.append(aisc)
-
-    # capex: high early, step down to steady from yr6
-    if year == 1:
-        capex = capex_y1
-    elif year <= 5:
-        step = (capex_y1 - capex_decline_to) / 5
-        capex = max(capex_y1 - step * (year - 1), capex_decline_to)
-    else:
-        capex = capex_decline_to
-    capexes.append(capex)
-
-    # FCF in AUD
-    margin = gold_price_aud - aisc
-    operating_cf = margin * prod
-    fcf = operating_cf - corp_costs - capex
-    fcfs.append(fcf)
-
-# discount FCFs and add terminal value at year 20
-for i, year in enumerate(years, start=1):
-    fcf = fcfs[i - 1]
-    if year == 20:
-        total = fcf + fcfs[-1] * terminal_multiple
-    else:
-        total = fcf
-    pv = total / ((1 + wacc) ** year)
-    pvs.append(pv)
-
-enterprise_value_aud = sum(pvs)
-equity_value_aud = enterprise_value_aud + cash_balance - deferred_liability
-value_per_share_aud = equity_value_aud / shares_out
+params = DcfParams(
+    production_y1, production_growth, gold_price_aud, aisc_y1, aisc_improvement, corp_costs,
+    capex_y1, capex_decline_to, wacc, terminal_multiple, cash_balance, deferred_liability, shares_out,
+)
+result = latest_dcf(params, horizon=20)
+productions, aiscs, capexes, fcfs, pvs = result.productions, result.aiscs, result.capexes, result.fcfs, result.pvs
+enterprise_value_aud, equity_value_aud = result.enterprise_value, result.equity_value
+value_per_share_aud = result.value_per_share
 
 # ─────────────────────────────────────────
 # AUD → GBP (÷2) and to £m
 # ─────────────────────────────────────────
-def aud_to_gbp_m(x: float) -> float:
+def aud_to_gbp_m(x: float | np.ndarray) -> float | np.ndarray:
     # AUD → GBP ≈ ÷2, then ÷1,000,000 → £m
     return x / 2_000_000
 
 ev_gbp_m = aud_to_gbp_m(enterprise_value_aud)
 eq_gbp_m = aud_to_gbp_m(equity_value_aud)
-fcf_gbp_m = [aud_to_gbp_m(f) for f in fcfs]
-pv_gbp_m = [aud_to_gbp_m(p) for p in pvs]
+fcf_gbp_m = aud_to_gbp_m(fcfs)
+pv_gbp_m = aud_to_gbp_m(pvs)
 vps_gbp = value_per_share_aud / 2  # AUD/share → GBP/share
 
 # ─────────────────────────────────────────
@@ -117,18 +71,21 @@ col2.metric("Equity value", f"£ {eq_gbp_m:,.0f} m")
 col3.metric("Value per share", f"£ {vps_gbp:,.2f}")
 
 st.subheader("20-Year Cash-Flow Forecast (£ m)")
-df = pd.DataFrame({
-    "Year": years,
-    "Production (oz)": [round(x) for x in productions],
-    "AISC (A$/oz)": [round(x) for x in aiscs],
-    "Capex (£ m)": [round(aud_to_gbp_m(x), 1) for x in capexes],
-    "FCF (£ m)": [round(x, 1) for x in fcf_gbp_m],
-    "Discounted FCF (£ m)": [round(x, 1) for x in pv_gbp_m],
+# polars builds both the forecast table and the sensitivity table further down
+import polars as pl
+
+df = pl.DataFrame({
+    "Year": result.years,
+    "Production (oz)": productions.round().astype(np.int64),
+    "AISC (A$/oz)": aiscs.round().astype(np.int64),
+    "Capex (£ m)": aud_to_gbp_m(capexes).round(1),
+    "FCF (£ m)": fcf_gbp_m.round(1),
+    "Discounted FCF (£ m)": pv_gbp_m.round(1),
 })
 st.dataframe(df)
 
 st.subheader("Discounted FCF profile (20 yrs, £ m)")
-st.line_chart(df.set_index("Year")["Discounted FCF (£ m)"])
+st.line_chart(df, x="Year", y="Discounted FCF (£ m)")
 
 # ─────────────────────────────────────────
 # SENSITIVITY (no styling → works without matplotlib)
@@ -138,48 +95,18 @@ st.subheader("Valuation sensitivity – value per share (£)")
 prod_options = [250_000, 300_000, 350_000, 400_000, 450_000, 500_000]
 gold_options = [4_200, 4_500, 4_800, 5_200, 5_500, 6_000]
 
-sens_rows = []
-for gold_assump in gold_options:
-    row = {"Gold (A$/oz)": gold_assump}
-    for prod_assump in prod_options:
-        # build alt 20-yr production for this combo
-        alt_prods = []
-        for year in years:
-            if year == 1:
-                alt_prods.append(prod_assump)
-            elif year <= 5:
-                alt_prods.append(alt_prods[-1] * (1 + production_growth))
-            elif year <= 15:
-                alt_prods.append(alt_prods[-1])
-            else:
-                alt_prods.append(alt_prods[-1] * 0.99)
-
-        # reuse aiscs and capexes from main run
-        alt_fcfs = []
-        for i, year in enumerate(years):
-            margin_tmp = gold_assump - aiscs[i]
-            op_cf_tmp = margin_tmp * alt_prods[i]
-            fcf_tmp = op_cf_tmp - corp_costs - capexes[i]
-            alt_fcfs.append(fcf_tmp)
-
-        # discount
-        alt_pvs = []
-        for i, year in enumerate(years, start=1):
-            fcf_tmp = alt_fcfs[i - 1]
-            total_tmp = fcf_tmp + (alt_fcfs[-1] * terminal_multiple if year == 20 else 0)
-            pv_tmp = total_tmp / ((1 + wacc) ** year)
-            alt_pvs.append(pv_tmp)
-
-        ev_tmp_aud = sum(alt_pvs)
-        eq_tmp_aud = ev_tmp_aud + cash_balance - deferred_liability
-        vps_tmp_aud = eq_tmp_aud / shares_out
-        vps_tmp_gbp = vps_tmp_aud / 2
-
-        row[f"{prod_assump//1000}k oz"] = round(vps_tmp_gbp, 2)
-    sens_rows.append(row)
-
-sens_df = pd.DataFrame(sens_rows)
-st.dataframe(sens_df)
+vps_tmp_gbp = latest_sensitivity(params, result, gold_options, prod_options)
+sens_df = pl.DataFrame({
+    "Gold (A$/oz)": gold_options,
+    **{f"{p // 1000}k oz": vps_tmp_gbp[:, j] for j, p in enumerate(prod_options)},
+})
+# progress bars on a shared scale stand in for a colour gradient, drawn client-side
+vps_min, vps_max = float(vps_tmp_gbp.min()), float(vps_tmp_gbp.max())
+st.dataframe(sens_df, hide_index=True, width="stretch", column_config={
+    "Gold (A$/oz)": st.column_config.NumberColumn(format="A$%,d"),
+    **{col: st.column_config.ProgressColumn(format="£%.2f", min_value=vps_min, max_value=vps_max)
+       for col in sens_df.columns if col != "Gold (A$/oz)"},
+})
 
 st.caption(
     "Use the table above to see when the DCF gets close to £6/share. "